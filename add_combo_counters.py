@@ -1,4 +1,4 @@
-import json
+from champ_store import submit
 
 # 조합 카운터 데이터 (원본 표기 그대로 저장)
 combo_counter_data = {
@@ -15,24 +15,17 @@ combo_counter_data = {
     "제라스":   ["(징크스|드븐|자야|케틀)&블츠", "(카이사|트타)&노틸", "아무무&미포"],
 }
 
-# JSONL 읽기
+# 챔피언별 combo_counters 필드만 덮어쓰기 (한 번의 커밋으로 반영)
 file_path = "champ.jsonl"
-lines = []
-with open(file_path, "r", encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if not line:
-            continue
-        data = json.loads(line)
-        champ_name = data.get("champion", "")
-        if champ_name in combo_counter_data:
-            data["combo_counters"] = combo_counter_data[champ_name]
-            print(f"✅ {champ_name} - combo_counters 추가됨")
-        lines.append(data)
-
-# JSONL 다시 쓰기
-with open(file_path, "w", encoding="utf-8") as f:
-    for data in lines:
-        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+ops = [
+    {"op": "update", "champion": champ_name, "fields": {"combo_counters": combos}}
+    for champ_name, combos in combo_counter_data.items()
+]
+results = submit(ops, file_path)
+for champ_name, result in zip(combo_counter_data, results):
+    if result == "updated":
+        print(f"✅ {champ_name} - combo_counters 추가됨")
+    else:
+        print(f"경고: '{champ_name}' 챔피언이 없어 combo_counters를 건너뜁니다.")
 
 print("\n완료! champ.jsonl 업데이트됨")
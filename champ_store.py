@@ -0,0 +1,379 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# champ.jsonl 동시 쓰기 경로
+# 여러 사람이 create.py / add_combo_counters.py / sort_temp.py를 동시에 돌려도 업데이트가 사라지지 않도록
+#   1) 각 작업은 변경 내용(op)을 큐 파일(champ.jsonl.queue)에 한 줄 추가만 하고
+#   2) 커밋 락을 먼저 잡은 프로세스가 큐에 쌓인 모든 작업을 모아 한 번에 반영(group commit)
+#   3) 파일은 임시 파일에 쓴 뒤 os.replace로 교체 -> 읽는 쪽(view_rapid.py)은 항상 완전한 파일만 봄
+#   4) 작업 결과(추가/교체/없음/오류)는 champ.jsonl.results/<id>.json으로 돌려줌
+#   5) 커밋 전에 중단된 프로세스의 작업은 큐에서 빠지므로 반영되지 않음
+
+TARGET_FILE = "champ.jsonl"
+# Windows는 다른 프로세스(view_rapid.py 등)가 파일을 열고 있으면 os.replace가 PermissionError를 냄
+# -> 0.05s부터 두 배씩(최대 1s) 늘려가며 다시 시도 (총 약 5초)
+REPLACE_RETRIES = 10
+REPLACE_MAX_BACKOFF = 1.0
+
+
+# --- 1. 파일 락 ---
+@contextmanager
+def file_lock(lock_path):
+    """lock_path 파일에 배타적 락을 겁니다. (다른 프로세스는 풀릴 때까지 대기)"""
+    with open(lock_path, 'a+') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 10초 후 포기하므로 다시 시도
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _commit_lock_path(file_path):
+    return file_path + ".lock"
+
+
+def _queue_path(file_path):
+    return file_path + ".queue"
+
+
+def _queue_lock_path(file_path):
+    return file_path + ".queue.lock"
+
+
+def _results_dir(file_path):
+    return file_path + ".results"
+
+
+# --- 2. 파일 읽기/쓰기 ---
+def load_records(file_path, strict=False):
+    """
+    JSONL 파일을 레코드 리스트로 읽습니다. (깨진 라인은 건너뜀)
+    strict=True면 깨진 라인에서 ValueError를 냅니다.
+    ⭐️ 파일을 다시 쓰는 커밋 경로는 반드시 strict로 읽어야 함 -> 건너뛴 라인이 저장 시 영영 사라지기 때문
+    """
+    if not os.path.exists(file_path):
+        return []
+    records = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                if strict:
+                    raise ValueError(f"'{file_path}' 파일 {line_no}번째 라인이 깨져있어 저장을 중단합니다. ({e})") from e
+                print(f"경고: '{file_path}' 파일의 일부 라인이 깨져있습니다. 해당 라인을 건너뜁니다.")
+    return records
+
+
+def _replace_with_retry(src, dst):
+    """os.replace를 하되, 대상 파일이 잠깐 열려 있어서 실패하면 잠시 기다렸다가 다시 시도합니다."""
+    delay = 0.05
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                raise
+            time.sleep(delay)
+            delay = min(delay * 2, REPLACE_MAX_BACKOFF)
+
+
+def _write_atomic(file_path, content):
+    """
+    content(bytes)를 임시 파일에 전부 쓴 뒤 os.replace로 교체합니다. (중간에 죽어도 기존 파일은 그대로)
+    ⭐️ mkstemp는 0600으로 만들기 때문에 기존 파일 권한(없으면 umask 기본값)을 복사해야
+    다른 큐레이터 계정이나 Streamlit 프로세스가 계속 읽을 수 있음
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".champ-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        _replace_with_retry(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_records_atomic(file_path, records):
+    """레코드 리스트를 JSONL로 원자적으로 저장합니다."""
+    content = "".join(json.dumps(data, ensure_ascii=False) + '\n' for data in records)
+    _write_atomic(file_path, content.encode('utf-8'))
+
+
+# --- 3. 작업(op) 검사/적용 ---
+def _is_name(value):
+    return isinstance(value, str) and bool(value.strip())
+
+
+def validate_ops(ops):
+    """작업 목록 형식을 검사합니다. 잘못된 작업은 큐에 넣기 전에 ValueError로 막습니다."""
+    if not isinstance(ops, list):
+        raise ValueError("작업 목록은 리스트여야 합니다.")
+    for op in ops:
+        kind = op.get('op') if isinstance(op, dict) else None
+        if kind == 'upsert':
+            data = op.get('data')
+            if not isinstance(data, dict) or not _is_name(data.get('champion')):
+                raise ValueError(f"upsert 작업에는 champion 이름이 있는 data가 필요합니다: {op}")
+        elif kind == 'update':
+            if not _is_name(op.get('champion')) or not isinstance(op.get('fields'), dict):
+                raise ValueError(f"update 작업에는 champion 이름과 fields 딕셔너리가 필요합니다: {op}")
+        elif kind != 'sort':
+            raise ValueError(f"알 수 없는 작업입니다: {op}")
+
+
+def apply_ops(records, ops):
+    """
+    작업 목록을 레코드 리스트에 순서대로 적용하고, 작업별 결과 목록을 반환합니다.
+    - {"op": "upsert", "data": {...}}: 같은 champion이 있으면 통째로 교체("replaced"), 없으면 추가("inserted")
+    - {"op": "update", "champion": ..., "fields": {...}}: 기존 레코드에 필드만 덮어쓰기("updated", 없으면 "missing")
+    - {"op": "sort"}: champion 이름순 정렬("sorted")
+    레코드 딕셔너리는 직접 수정하지 않으므로, 호출자는 리스트만 얕은 복사해서 실패 시 되돌릴 수 있습니다.
+    """
+    positions = {data.get('champion'): i for i, data in enumerate(records)}
+    results = []
+    for op in ops:
+        kind = op.get('op')
+        if kind == 'upsert':
+            data = op['data']
+            i = positions.get(data['champion'])
+            if i is None:
+                positions[data['champion']] = len(records)
+                records.append(data)
+                results.append("inserted")
+            else:
+                records[i] = data
+                results.append("replaced")
+        elif kind == 'update':
+            i = positions.get(op['champion'])
+            if i is None:
+                results.append("missing")
+                continue
+            records[i] = {**records[i], **op['fields']}
+            results.append("updated")
+        elif kind == 'sort':
+            records.sort(key=lambda x: str(x.get('champion') or ''))
+            positions = {data.get('champion'): i for i, data in enumerate(records)}
+            results.append("sorted")
+        else:
+            raise ValueError(f"알 수 없는 작업입니다: {kind}")
+    return results
+
+
+# --- 4. 쓰기 큐 + group commit ---
+# 결과 파일은 보통 바로 읽고 지우지만, 기다리던 프로세스가 죽으면 남으므로 커밋할 때 오래된 것을 정리
+RESULT_TTL_SECONDS = 60 * 60
+
+
+def _read_queue(file_path, warn=False):
+    """
+    큐 파일을 [(작업 묶음 또는 None, 원본 라인 bytes), ...]로 읽습니다. 호출자가 큐 락을 잡고 있어야 합니다.
+    깨진 라인은 None으로 표시하고, 이 작업을 넣은 프로세스는 결과 파일이 없으므로 submit에서 오류를 받습니다.
+    """
+    queue_path = _queue_path(file_path)
+    if not os.path.exists(queue_path):
+        return []
+    with open(queue_path, 'rb') as f:
+        raw = f.read()
+    lines = []
+    for line in raw.splitlines(keepends=True):
+        if not line.endswith(b'\n'):
+            continue  # 추가 도중 죽은 프로세스의 덜 써진 마지막 줄
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            if warn:
+                print(f"경고: '{queue_path}' 파일의 일부 라인이 깨져있습니다. 해당 라인을 건너뜁니다.")
+            entry = None
+        lines.append((entry, line))
+    return lines
+
+
+def _queued_ids(lines):
+    return {entry.get('id') for entry, _ in lines if isinstance(entry, dict)}
+
+
+def _remove_from_queue(file_path, ids, drop_broken=False):
+    """
+    ids에 해당하는 작업(과 drop_broken이면 깨진 라인)을 큐에서 지웁니다. 호출자가 큐 락을 잡고 있어야 합니다.
+    (제자리에서 덮어쓰다 죽으면 대기 중인 작업이 사라지므로 임시 파일 + os.replace로 교체)
+    """
+    kept = []
+    for entry, line in _read_queue(file_path):
+        if entry is None:
+            if not drop_broken:
+                kept.append(line)
+        elif entry.get('id') not in ids:
+            kept.append(line)
+    _write_atomic(_queue_path(file_path), b"".join(kept))
+
+
+def _write_result(file_path, entry_id, result):
+    """커밋 담당 프로세스가 다른 프로세스의 작업 결과를 남겨둡니다."""
+    results_dir = _results_dir(file_path)
+    os.makedirs(results_dir, exist_ok=True)
+    _write_atomic(os.path.join(results_dir, f"{entry_id}.json"), json.dumps(result, ensure_ascii=False).encode('utf-8'))
+
+
+def _take_result(file_path, entry_id):
+    """다른 프로세스가 대신 반영한 내 작업의 결과를 읽고 지웁니다."""
+    result_path = os.path.join(_results_dir(file_path), f"{entry_id}.json")
+    if not os.path.exists(result_path):
+        raise RuntimeError("큐에서 작업이 사라졌지만 결과가 없습니다. (큐 라인 손상) 작업이 반영되지 않았을 수 있습니다.")
+    with open(result_path, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    os.remove(result_path)
+    return result
+
+
+def _sweep_results(file_path):
+    """RESULT_TTL_SECONDS보다 오래된 결과 파일(가져갈 프로세스가 죽은 것)을 지웁니다."""
+    results_dir = _results_dir(file_path)
+    if not os.path.isdir(results_dir):
+        return
+    cutoff = time.time() - RESULT_TTL_SECONDS
+    for name in os.listdir(results_dir):
+        path = os.path.join(results_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _unpack_result(result):
+    if 'error' in result:
+        raise ValueError(f"작업을 반영하지 못했습니다: {result['error']}")
+    return result['results']
+
+
+def _apply_entries(base_records, entries):
+    """작업 묶음을 순서대로 적용해 (새 레코드 리스트, {id: 결과})를 반환합니다. 실패한 묶음만 되돌립니다."""
+    records = list(base_records)
+    results = {}
+    for entry in entries:
+        working = list(records)
+        try:
+            validate_ops(entry.get('ops'))
+            results[entry.get('id')] = {"results": apply_ops(working, entry['ops'])}
+        except Exception as e:
+            results[entry.get('id')] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        records = working
+    return records, results
+
+
+def _commit(file_path):
+    """
+    큐에 쌓인 작업을 모두 반영합니다. 호출자가 커밋 락을 잡고 있어야 합니다.
+    무거운 적용 단계는 큐 락 밖에서 하고, 파일 교체와 큐 정리는 큐 락 안에서 한 번에 합니다.
+    그 사이 중단(Ctrl-C)으로 빠진 작업이 있으면 그 작업을 빼고 다시 적용합니다.
+    """
+    base_records = load_records(file_path, strict=True)
+    with file_lock(_queue_lock_path(file_path)):
+        entries = [entry for entry, _ in _read_queue(file_path, warn=True) if isinstance(entry, dict)]
+    records, results = _apply_entries(base_records, entries)
+
+    with file_lock(_queue_lock_path(file_path)):
+        still_queued = _queued_ids(_read_queue(file_path))
+        if any(entry.get('id') not in still_queued for entry in entries):
+            entries = [entry for entry in entries if entry.get('id') in still_queued]
+            records, results = _apply_entries(base_records, entries)
+        write_records_atomic(file_path, records)
+        for entry_id, result in results.items():
+            if entry_id:
+                _write_result(file_path, entry_id, result)
+        _remove_from_queue(file_path, set(results), drop_broken=True)
+    _sweep_results(file_path)
+
+
+def _withdraw(file_path, entry_id):
+    """
+    중단된 프로세스의 작업을 큐에서 뺍니다.
+    빼면 True, 이미 커밋돼서 뺄 수 없으면 결과 파일만 정리하고 False, 큐에도 결과에도 없으면 None을 반환합니다.
+    """
+    result_path = os.path.join(_results_dir(file_path), f"{entry_id}.json")
+    with file_lock(_queue_lock_path(file_path)):
+        # 결과 파일은 champ.jsonl을 교체한 뒤에 쓰므로, 있으면 이미 반영된 것
+        if os.path.exists(result_path):
+            os.remove(result_path)
+            return False
+        if entry_id in _queued_ids(_read_queue(file_path)):
+            _remove_from_queue(file_path, {entry_id})
+            return True
+    return None
+
+
+def submit(ops, file_path=TARGET_FILE):
+    """
+    작업 목록을 큐에 넣고, 파일에 반영될 때까지 기다린 뒤 작업별 결과 목록을 반환합니다.
+    커밋 락을 잡았을 때 내 작업이 아직 큐에 있으면 내가 커밋 담당이 되어
+    그동안 다른 프로세스들이 쌓아둔 작업까지 모아서 한 번에 파일을 다시 씁니다.
+    실패한 작업 묶음은 그 묶음만 건너뛰고, 해당 작업을 넣은 프로세스에서 ValueError가 발생합니다.
+    기다리는 도중 중단(Ctrl-C, 예외)되면 아직 커밋 전인 작업은 큐에서 빼므로 반영되지 않습니다.
+    (이미 커밋된 뒤라면 되돌리지 않고 경고만 출력)
+    """
+    validate_ops(ops)
+    entry_id = uuid.uuid4().hex
+    line = json.dumps({"id": entry_id, "ops": ops}, ensure_ascii=False) + '\n'
+
+    # 1) 큐에 추가 (파일 전체를 다시 쓰지 않으므로 빠름)
+    with file_lock(_queue_lock_path(file_path)):
+        with open(_queue_path(file_path), 'a', encoding='utf-8') as f:
+            f.write(line)
+
+    # 2) 커밋 락을 잡고, 아직 반영이 안 됐으면 쌓인 작업을 모두 반영
+    try:
+        with file_lock(_commit_lock_path(file_path)):
+            with file_lock(_queue_lock_path(file_path)):
+                pending = entry_id in _queued_ids(_read_queue(file_path))
+            if pending:
+                _commit(file_path)
+            result = _take_result(file_path, entry_id)
+    except BaseException:
+        if _withdraw(file_path, entry_id) is False:
+            print("경고: 중단됐지만 이 작업은 이미 champ.jsonl에 반영되었습니다.")
+        raise
+    return _unpack_result(result)
+
+
+def upsert(data, file_path=TARGET_FILE):
+    """챔피언 레코드 하나를 추가하거나 통째로 교체합니다. ("inserted" 또는 "replaced" 반환)"""
+    return submit([{"op": "upsert", "data": data}], file_path)[0]
@@ -1,6 +1,5 @@
-import json
-import os
 import re
+from champ_store import upsert
 #from dotenv import load_dotenv
 
 # .env 파일 로드 (LLM 요약을 위해 필요할 수 있음)
@@ -10,27 +9,7 @@ TARGET_FILE = "champ.jsonl" # 우리가 최종 저장할 파일
 HARD_KEYWORDS = ["하드 카운터", "하드카운터", "극상성", "닷지", "최악의 상대", "매우 불리하다", "극카운터", "극 카운터", "최악의 카운터", "필벤"]
 
 # --- 1. 파일 관리 함수 ---
-def load_and_prepare_data(file_path):
-    """기존 JSONL 데이터를 리스트로 로드합니다."""
-    if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-        return []
-    
-    data_list = []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                data_list.append(json.loads(line))
-            except json.JSONDecodeError:
-                print(f"경고: '{file_path}' 파일의 일부 라인이 깨져있습니다. 해당 라인을 건너뜕니다.")
-    return data_list
-
-def save_data(file_path, data_list):
-    """
-    데이터 리스트를 JSONL 형식으로 저장합니다.
-    """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        for i, champ_data in enumerate(data_list):
-            f.write(json.dumps(champ_data, ensure_ascii=False) + '\n')
+# ⭐️ 다른 사람이 동시에 champ.jsonl을 수정해도 덮어쓰지 않도록 champ_store의 락/큐 경로로 저장함
 
 # --- 2. 핵심 파싱 로직 ---
 def parse_manual_data(champion_name, raw_aliases_text, raw_counters_text, raw_footnotes_text):
@@ -160,24 +139,12 @@ def main():
     # 5. 파싱 실행
     new_champion_data = parse_manual_data(CHAMPION_NAME, RAW_ALIASES_TEXT, RAW_COUNTERS_TEXT, RAW_FOOTNOTES_TEXT)
 
-    # 6. 기존 데이터 로드
-    all_data_list = load_and_prepare_data(TARGET_FILE)
-
-    # 7. 데이터 업데이트 또는 추가
-    updated = False
-    for i, data in enumerate(all_data_list):
-        if data.get('champion') == new_champion_data['champion']:
-            all_data_list[i] = new_champion_data # 기존 데이터 덮어쓰기
-            updated = True 
-            print(f"'{new_champion_data['champion']}'의 데이터를 업데이트했습니다.")
-            break
-            
-    if not updated:
-        all_data_list.append(new_champion_data) # 새 데이터 추가
+    # 6. 데이터 업데이트 또는 추가 (같은 챔피언이 있으면 덮어쓰기) 후 파일 저장
+    result = upsert(new_champion_data, TARGET_FILE)
+    if result == "replaced":
+        print(f"'{new_champion_data['champion']}'의 데이터를 업데이트했습니다.")
+    else:
         print(f"'{new_champion_data['champion']}'의 데이터를 새로 추가했습니다.")
-
-    # 8. 파일 저장
-    save_data(TARGET_FILE, all_data_list)
     print(f"성공: 데이터가 '{TARGET_FILE}' 파일에 저장되었습니다.")
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,309 @@
+import heapq
+import json
+import random
+import re
+import sys
+import time
+import zlib
+
+# MinHash / LSH 설정
+# 64개의 해시 = 카운터 이름용 48개 + 이유 텍스트용 16개
+# 32밴드 x 2행 -> 추정 유사도 약 0.2 이상이면 후보로 잡힐 확률이 높음
+NUM_PERM = 64
+REASON_PERM = 16
+BANDS = 32
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+SEED = 1218
+# 같은 밴드를 많이 공유한 후보부터 최대 max(k * CANDIDATE_FACTOR, MIN_CANDIDATES)개만 정밀 비교
+CANDIDATE_FACTOR = 4
+MIN_CANDIDATES = 20
+
+# 조합 카운터 표기("(카이사|트타)&노틸")에서 챔피언 이름만 뽑아낼 때 쓰는 구분자
+COMBO_SPLIT_PATTERN = re.compile(r'[()|&]')
+# 이유 텍스트에서 각주 번호([47] 등) 제거
+FOOTNOTE_PATTERN = re.compile(r'\[\d+\]')
+# 어절 앞뒤의 문장부호 제거 ("없다." -> "없다")
+PUNCT_PATTERN = re.compile(r'^\W+|\W+$')
+# 이유 텍스트 대부분에 나오는 기능어/상투어 -> 상성과 관계없이 아무 챔피언이나 후보로 끌어오므로 제외
+REASON_STOPWORDS = {
+    "수", "수가", "수도", "있다", "있는", "있기", "있어", "있으며", "없다", "없는", "때문에", "때문", "때문이다",
+    "것", "것이", "것도", "것은", "건", "게", "한", "할", "하는", "한다", "해도", "된다", "되는", "안", "못",
+    "더", "잘", "다", "그", "이", "중", "때", "매우", "모든", "다른", "가장", "거의", "훨씬", "그냥", "아예",
+    "절대", "크게", "쉽게", "오히려", "심지어", "그나마", "게다가", "또한", "하지만", "그리고", "정도로", "경우",
+    "하드", "카운터", "상대", "상대로", "최악의",
+}
+
+
+# --- 1. 특징(토큰) 추출 ---
+def shingle_reason(reason, size=1):
+    """
+    이유 텍스트를 어절 n-gram 집합으로 만듭니다.
+    기본값은 불용어(REASON_STOPWORDS)를 뺀 어절 1-gram(단어 집합)입니다.
+    2-gram 이상은 챔피언 간에 거의 겹치지 않아(실데이터 자카드 1% 미만) 이유 슬롯이 사실상 쓸모없어짐
+    """
+    words = [PUNCT_PATTERN.sub('', word) for word in FOOTNOTE_PATTERN.sub('', reason).split()]
+    words = [word for word in words if word and word not in REASON_STOPWORDS]
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def extract_features(data):
+    """
+    챔피언 레코드 하나에서 (카운터 프로필 토큰 집합, 이유 단어 집합)을 만듭니다.
+    ⭐️ 이유 텍스트는 토큰 수가 이름보다 열 배 이상 많아서, 한 집합에 섞으면 유사도가 이유 텍스트에 묻혀버림
+    """
+    features = set()
+    reason_features = set()
+
+    for counter in data.get('hard_counters') or []:
+        name = counter.get('name', '').strip()
+        if name:
+            # 하드/일반 구분 없이 '나를 카운터치는 챔피언'으로 한 번, 하드 카운터로 한 번 더 넣어 가중치를 줌
+            features.add(f"name:{name}")
+            features.add(f"hard:{name}")
+        for shingle in shingle_reason(counter.get('reason', '')):
+            reason_features.add(shingle)
+
+    for name in data.get('general_counters') or []:
+        if name:
+            features.add(f"name:{name.strip()}")
+
+    for combo in data.get('combo_counters') or []:
+        features.add(f"combo:{combo.strip()}")
+        for name in COMBO_SPLIT_PATTERN.split(combo):
+            if name.strip():
+                features.add(f"combo_name:{name.strip()}")
+
+    return features, reason_features
+
+
+# --- 2. MinHash 시그니처 ---
+def make_permutations(num_perm=NUM_PERM, seed=SEED):
+    """(a, b) 계수 쌍으로 된 해시 함수 목록을 만듭니다. (h(x) = (a*x + b) mod p)"""
+    rng = random.Random(seed)
+    return [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)]
+
+
+def minhash_signature(features, permutations):
+    """토큰 집합의 MinHash 시그니처(튜플)를 계산합니다."""
+    if not features:
+        return tuple([MAX_HASH] * len(permutations))
+    # ⭐️ 파이썬 내장 hash()는 실행마다 값이 바뀌므로 crc32로 고정된 기본 해시를 씀
+    base_hashes = [zlib.crc32(feature.encode('utf-8')) for feature in features]
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in base_hashes) & MAX_HASH
+        for a, b in permutations
+    )
+
+
+def estimate_jaccard(sig_a, sig_b):
+    """
+    두 시그니처에서 일치하는 해시 비율로 유사도를 추정합니다.
+    ⭐️ 한쪽이라도 빈 집합인 슬롯(하드 카운터가 없는 챔피언의 이유 슬롯)은 분모에서 뺌
+    -> 양쪽 다 이유가 있으면 이름 48/64 + 이유 16/64의 가중 평균, 아니면 이름 자카드만
+    """
+    matched = filled = 0
+    for x, y in zip(sig_a, sig_b):
+        if x == MAX_HASH or y == MAX_HASH:
+            continue
+        filled += 1
+        if x == y:
+            matched += 1
+    return matched / filled if filled else 0.0
+
+
+# --- 3. LSH 인덱스 ---
+class SimilarityIndex:
+    """MinHash + LSH 밴딩으로 카운터 프로필이 비슷한 챔피언을 찾는 인덱스입니다."""
+
+    def __init__(self, num_perm=NUM_PERM, reason_perm=REASON_PERM, bands=BANDS, seed=SEED):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어 떨어져야 합니다.")
+        if not 0 <= reason_perm < num_perm:
+            raise ValueError(f"reason_perm({reason_perm})은 0 이상 num_perm({num_perm}) 미만이어야 합니다.")
+        self.bands = bands
+        self.rows = num_perm // bands
+        permutations = make_permutations(num_perm, seed)
+        self.name_permutations = permutations[:num_perm - reason_perm]
+        self.reason_permutations = permutations[num_perm - reason_perm:]
+        self.signatures = {}  # 챔피언 이름 -> 시그니처
+        self.buckets = [{} for _ in range(bands)]  # 밴드별 {밴드 해시값: [챔피언 이름, ...]}
+
+    def _band_keys(self, signature):
+        """(밴드 번호, 밴드 값) 목록을 반환합니다. 빈 집합으로 채워진 밴드는 버킷에 넣지 않습니다."""
+        rows = self.rows
+        empty_band = (MAX_HASH,) * rows
+        keys = []
+        for i in range(self.bands):
+            key = signature[i * rows:(i + 1) * rows]
+            if key != empty_band:
+                keys.append((i, key))
+        return keys
+
+    def add(self, champion, features, reason_features=()):
+        """챔피언 하나의 토큰 집합을 인덱스에 추가합니다. (카운터 정보가 없으면 추가하지 않음)"""
+        if champion in self.signatures:
+            self.remove(champion)
+        if not features:
+            return
+        signature = (minhash_signature(features, self.name_permutations)
+                     + minhash_signature(reason_features, self.reason_permutations))
+        self.signatures[champion] = signature
+        for i, key in self._band_keys(signature):
+            self.buckets[i].setdefault(key, []).append(champion)
+
+    def remove(self, champion):
+        """인덱스에서 챔피언을 제거합니다."""
+        signature = self.signatures.pop(champion, None)
+        if signature is None:
+            return
+        for i, key in self._band_keys(signature):
+            members = self.buckets[i].get(key)
+            if members and champion in members:
+                members.remove(champion)
+                if not members:
+                    del self.buckets[i][key]
+
+    def query(self, champion, k=5):
+        """
+        champion과 카운터 프로필이 비슷한 챔피언 상위 k개를 [(이름, 추정 유사도), ...]로 반환합니다.
+        전체 쌍 비교 대신 같은 밴드 버킷에 걸린 후보만 비교합니다.
+        ⭐️ 밴드가 느슨해서(2행) 후보가 수백 개까지 늘어나므로, 공유한 밴드 수로 먼저 추려서 상위 일부만 계산함
+        (공유 밴드 수는 유사도에 비례하므로 순위가 거의 바뀌지 않음)
+        """
+        signature = self.signatures.get(champion)
+        if signature is None:
+            return []
+
+        shared_bands = {}
+        for i, key in self._band_keys(signature):
+            for other in self.buckets[i].get(key, ()):
+                shared_bands[other] = shared_bands.get(other, 0) + 1
+        shared_bands.pop(champion, None)
+
+        limit = max(k * CANDIDATE_FACTOR, MIN_CANDIDATES)
+        if len(shared_bands) > limit:
+            candidates = heapq.nlargest(limit, shared_bands, key=shared_bands.get)
+        else:
+            candidates = shared_bands
+
+        scored = [(other, estimate_jaccard(signature, self.signatures[other])) for other in candidates]
+        scored.sort(key=lambda x: (-x[1], x[0]))
+        return scored[:k]
+
+    def __len__(self):
+        return len(self.signatures)
+
+
+def build_similarity_index(records, **kwargs):
+    """챔피언 레코드 목록으로 SimilarityIndex를 만듭니다."""
+    index = SimilarityIndex(**kwargs)
+    for data in records:
+        index.add(data['champion'], *extract_features(data))
+    return index
+
+
+# --- 4. 벤치마크 ---
+def make_synthetic_catalog(size, seed=SEED):
+    """
+    벤치마크용 가상 챔피언 카탈로그를 만듭니다.
+    비슷한 상성 그룹(family)을 만들어 두고, 그룹 내 레코드는 카운터 목록 일부만 바꿔서 생성합니다.
+    """
+    rng = random.Random(seed)
+    pool = [f"챔피언{i}" for i in range(max(200, size // 10))]
+    words = [f"단어{i}" for i in range(2000)]
+    family_size = 10
+
+    records = []
+    for family_id in range((size + family_size - 1) // family_size):
+        base_general = rng.sample(pool, 12)
+        base_hard = rng.sample(pool, 3)
+        base_reason = [rng.choice(words) for _ in range(20)]
+        for member in range(family_size):
+            if len(records) >= size:
+                break
+            general = [name if rng.random() > 0.15 else rng.choice(pool) for name in base_general]
+            reason = [word if rng.random() > 0.1 else rng.choice(words) for word in base_reason]
+            records.append({
+                "champion": f"가상{family_id}-{member}",
+                "aliases": [],
+                "hard_counters": [{"name": name, "reason": " ".join(reason)} for name in base_hard],
+                "general_counters": general,
+            })
+    return records
+
+
+def jaccard(a, b):
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def brute_force_query(feature_sets, champion, k=5, reason_weight=REASON_PERM / NUM_PERM):
+    """비교용: 모든 레코드와 정확한 (가중) 자카드 유사도를 계산합니다."""
+    target, target_reason = feature_sets[champion]
+    scored = []
+    for other, (features, reason_features) in feature_sets.items():
+        if other == champion:
+            continue
+        if target_reason and reason_features:
+            score = (1 - reason_weight) * jaccard(target, features) + reason_weight * jaccard(target_reason, reason_features)
+        else:
+            score = jaccard(target, features)
+        scored.append((other, score))
+    scored.sort(key=lambda x: (-x[1], x[0]))
+    return scored[:k]
+
+
+def run_benchmark(sizes=(1000, 10000, 100000), num_queries=200, k=5):
+    """가상 카탈로그 크기별로 인덱스 구축 시간, 질의 시간, 전체 비교 대비 recall을 출력합니다."""
+    for size in sizes:
+        records = make_synthetic_catalog(size)
+
+        start = time.perf_counter()
+        index = build_similarity_index(records)
+        build_sec = time.perf_counter() - start
+
+        rng = random.Random(size)
+        queries = [data['champion'] for data in rng.sample(records, min(num_queries, size))]
+
+        start = time.perf_counter()
+        results = [index.query(champion, k) for champion in queries]
+        query_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        # 전체 비교는 느리므로 일부 질의만 비교
+        feature_sets = {data['champion']: extract_features(data) for data in records}
+        sample = queries[:20]
+        hits = 0
+        start = time.perf_counter()
+        for champion, lsh_result in zip(sample, results):
+            exact = {name for name, _ in brute_force_query(feature_sets, champion, k)}
+            hits += len(exact & {name for name, _ in lsh_result})
+        brute_ms = (time.perf_counter() - start) * 1000 / len(sample)
+
+        print(f"[{size:>6}개] 구축 {build_sec:6.2f}s | LSH 질의 {query_ms:.3f}ms "
+              f"| 전체 비교 {brute_ms:8.2f}ms | recall@{k} {hits / (len(sample) * k):.2f}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        sizes = tuple(int(arg) for arg in sys.argv[1:])
+    else:
+        sizes = (1000, 10000, 100000)
+
+    print("--- 비슷한 상성 챔피언 검색 벤치마크 (MinHash/LSH) ---")
+    run_benchmark(sizes)
+
+    # 실제 데이터로 예시 출력
+    with open('champ.jsonl', 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    index = build_similarity_index(records)
+    champion = records[0]['champion']
+    print(f"\n예시: '{champion}'와 비슷한 상성 챔피언")
+    for name, score in index.query(champion):
+        print(f"  - {name} (유사도 {score:.0%})")
+
+
+if __name__ == '__main__':
+    main()
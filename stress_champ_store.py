@@ -0,0 +1,85 @@
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from champ_store import TARGET_FILE, apply_ops, file_lock, load_records, upsert, write_records_atomic
+
+# champ_store 동시 쓰기 스트레스 테스트
+# champ.jsonl 복사본에 여러 프로세스가 동시에 쓰고, 사라진 편집이 없는지와 처리량을 비교합니다.
+# 사라진 편집/죽은 프로세스가 있거나 group commit이 더 느리면 0이 아닌 코드로 종료합니다.
+
+
+def _edit(writer_id, n):
+    return {"champion": f"테스트{writer_id}-{n}", "aliases": [], "hard_counters": [], "general_counters": []}
+
+
+def serialized_writer(file_path, writer_id, num_edits):
+    """비교용: 편집마다 락을 잡고 파일 전체를 읽고 다시 씀"""
+    for n in range(num_edits):
+        with file_lock(file_path + ".lock"):
+            records = load_records(file_path, strict=True)
+            apply_ops(records, [{"op": "upsert", "data": _edit(writer_id, n)}])
+            write_records_atomic(file_path, records)
+
+
+def queued_writer(file_path, writer_id, num_edits):
+    for n in range(num_edits):
+        upsert(_edit(writer_id, n), file_path)
+
+
+def run_writers(target, seed_file, num_writers, num_edits):
+    """
+    seed_file 복사본에 num_writers개 프로세스가 동시에 쓰고
+    (소요 시간, 사라진 편집 수, 비정상 종료한 프로세스 수)를 반환합니다.
+    """
+    work_dir = tempfile.mkdtemp(prefix="champ-stress-")
+    try:
+        file_path = os.path.join(work_dir, "champ.jsonl")
+        shutil.copyfile(seed_file, file_path)
+        base_champions = {data.get('champion') for data in load_records(file_path)}
+
+        processes = [multiprocessing.Process(target=target, args=(file_path, i, num_edits)) for i in range(num_writers)]
+        start = time.perf_counter()
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        elapsed = time.perf_counter() - start
+
+        crashed = sum(1 for p in processes if p.exitcode != 0)
+        champions = {data.get('champion') for data in load_records(file_path, strict=True)}
+        expected = {f"테스트{i}-{n}" for i in range(num_writers) for n in range(num_edits)}
+        return elapsed, len((expected | base_champions) - champions), crashed
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    args = [int(arg) for arg in sys.argv[1:3]]
+    num_writers, num_edits = (args + [16, 25][len(args):])[:2]
+    total = num_writers * num_edits
+
+    print(f"--- champ.jsonl 동시 쓰기 스트레스 테스트: 프로세스 {num_writers}개 x 편집 {num_edits}개 ---")
+    throughput = {}
+    failed = False
+    for label, target in [("락 + 편집마다 전체 재작성", serialized_writer),
+                          ("락 + 큐 group commit", queued_writer)]:
+        elapsed, lost, crashed = run_writers(target, TARGET_FILE, num_writers, num_edits)
+        throughput[target] = total / elapsed
+        print(f"{label:<20} | {elapsed:6.2f}s | {total / elapsed:7.1f} 편집/s | 사라진 편집 {lost}개 | 비정상 종료 {crashed}개")
+        if lost or crashed:
+            failed = True
+
+    if throughput[queued_writer] <= throughput[serialized_writer]:
+        print("실패: group commit이 편집마다 전체 재작성보다 빠르지 않습니다.")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("성공: 사라진 편집 없이 group commit이 더 빠릅니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import streamlit as st
 import json
 from dotenv import load_dotenv
+from similar_champ import build_similarity_index
 
 # .env 파일에서 환경 변수 로드
 # (참고: Streamlit Community Cloud에 배포할 땐 .env 대신 Secrets를 써야 함)
@@ -37,6 +38,16 @@ def load_champion_data(file_path):
     return champion_dict
 
 
+# 유사도 인덱스는 데이터가 아니라 객체이므로 cache_resource로 한 번만 생성
+@st.cache_resource
+def load_similarity_index(file_path):
+    """챔피언 데이터로 '비슷한 상성 챔피언' 검색용 MinHash/LSH 인덱스를 만듭니다."""
+    champion_data_store = load_champion_data(file_path)
+    # 별칭 키가 같은 데이터를 가리키므로 챔피언 이름 기준으로 중복 제거
+    records = {data['champion']: data for data in champion_data_store.values()}
+    return build_similarity_index(records.values())
+
+
 def format_hard_counters(counters):
     """하드 카운터 목록의 형식을 지정합니다."""
     # counters가 리스트가 아니거나 비어있으면 빈 문자열 반환
@@ -70,12 +81,22 @@ def render_combo_counters(combos):
         else:
             st.markdown(f"- {combo}")
 
+def render_similar_champions(similar):
+    """카운터 프로필이 비슷한 챔피언 목록을 렌더링합니다."""
+    st.markdown("### 🧭 비슷한 상성 챔피언")
+    if not similar:
+        st.markdown("정보 없음")
+        return
+    st.caption("밴/픽으로 챔피언을 못 쓸 때, 카운터 구성이 비슷한 챔피언입니다.")
+    st.markdown("\n".join([f"  - **{name}** (유사도 {score:.0%})" for name, score in similar]))
+
 def main():
     """Streamlit 웹 앱의 메인 함수입니다."""
     st.title("👑 LOL 챔피언 카운터 조회 👑") # AI 챗봇이 아니므로 제목 변경
 
     # 데이터 로드 (딕셔너리 형태로)
     champion_data_store = load_champion_data('champ.jsonl')
+    similarity_index = load_similarity_index('champ.jsonl')
 
     if not champion_data_store:
         st.warning("챔피언 데이터가 없습니다. 'champ.jsonl' 파일을 확인해주세요.")
@@ -103,6 +124,7 @@ def main():
                 hard_counters_str = format_hard_counters(found_data.get('hard_counters'))
                 general_counters_str = format_general_counters(found_data.get('general_counters'))
                 combo_counters = found_data.get('combo_counters', [])
+                similar_champions = similarity_index.query(found_data['champion'], k=5)
 
                 # 2. 결과 출력
                 st.markdown("---")
@@ -122,6 +144,11 @@ def main():
                 # 일반 카운터
                 st.markdown("### 🔥 일반 카운터")
                 st.markdown(general_counters_str)
+
+                st.markdown("---")
+
+                # 비슷한 상성 챔피언
+                render_similar_champions(similar_champions)
                 
         else:
             st.warning("챔피언 이름을 입력해주세요.")